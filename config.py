@@ -35,6 +35,15 @@ class InputSource(Enum):
     SYSTEM_PATTERN = auto()
     INTERNAL_THOUGHT = auto()
 
+# Source groupings shared by ingest, scoring, correlation and the store.
+# Defined once here so the modules can't drift apart.
+MIC_SOURCES = frozenset({InputSource.MICROPHONE, InputSource.DIRECT_MICROPHONE})
+CHAT_SOURCES = frozenset({InputSource.TWITCH_CHAT, InputSource.TWITCH_MENTION})
+HIGH_URGENCY_SOURCES = frozenset({InputSource.DIRECT_MICROPHONE, InputSource.TWITCH_MENTION})
+CONVERSATIONAL_SOURCES = frozenset({
+    InputSource.DIRECT_MICROPHONE, InputSource.MICROPHONE, InputSource.TWITCH_CHAT,
+})
+
 SOURCE_WEIGHTS = {
     InputSource.DIRECT_MICROPHONE: 0.8,
     InputSource.TWITCH_MENTION: 0.8,
@@ -126,11 +135,19 @@ POST_SPEECH_COOLDOWN = 5.0
 # --- Director Config ---
 DIRECTOR_PORT = 8006
 HUB_URL = "http://localhost:8002"
+# The hub is local and speaks WebSocket, so skip the long-polling probe and
+# upgrade round trips. Flip on only if a proxy in between can't carry WS.
+HUB_ALLOW_POLLING = False
 DIRECTOR_HOST = "0.0.0.0"
 WINDOW_IMMEDIATE = 10.0
 WINDOW_RECENT = 30.0
 WINDOW_BACKGROUND = 300.0
 SUMMARY_INTERVAL_SECONDS = 5.0
+# Send event_scored as a msgpack binary attachment on 'event_scored_bin'
+# instead of JSON on 'event_scored'. Off until the hub relay and UI listen
+# on the binary channel; director_state always stays JSON. Needs the
+# optional msgpack package (pip install msgpack); ignored without it.
+EVENT_SCORED_MSGPACK = False
 INTERJECTION_THRESHOLD = 0.75
 VALID_MOODS = ["Neutral", "Happy", "Annoyed", "Scared", "Horny", "Tired"]
 DEFAULT_MOOD = "Neutral"
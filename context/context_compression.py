@@ -7,7 +7,7 @@ from typing import Any, Optional
 import google.generativeai as genai  # type: ignore
 from google.generativeai.types import HarmCategory, HarmBlockThreshold  # type: ignore
 
-from context.context_store import ContextStore, EventItem
+from context.context_store import ContextStore
 from config import OLLAMA_TIMEOUT_COMPRESS, COMPRESSION_INTERVAL, InputSource, GEMINI_API_KEY
 from diagnostics import log_error
 
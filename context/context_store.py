@@ -3,6 +3,8 @@ import time
 import threading
 import uuid
 import collections
+import heapq
+import itertools
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Tuple, Optional
 from config import (
@@ -16,7 +18,7 @@ from scoring import EventScore
 import config
 from services.conversation_threading import ConversationThreadManager  # ✅ ADD THIS HERE
 
-@dataclass
+@dataclass(slots=True)
 class EventItem:
     timestamp: float
     source: InputSource
@@ -65,6 +67,11 @@ class ContextStore:
         # to slice narrative_log, then calls archive_ancient_history which also
         # takes self.lock → deadlock on a plain Lock, freezing the asyncio loop).
         self.lock = threading.RLock()
+        # Bumped whenever the breadcrumb candidate pool (immediate + recent)
+        # or a score in it changes. /breadcrumbs is polled far more often
+        # than events arrive, so the top-N list is cached against it.
+        self._events_version = 0
+        self._breadcrumb_cache: Dict[int, Tuple[int, List[Dict[str, Any]]]] = {}
         
         self.pending_speech_event: Optional[EventItem] = None
         self.pending_speech_lock = threading.Lock()
@@ -121,6 +128,7 @@ class ContextStore:
         item = EventItem(timestamp=now, source=source, text=text, metadata=metadata, score=score)
         with self.lock:
             self.immediate.append(item)
+            self._events_version += 1
             self._manage_hierarchy_nolock() 
         return item
 
@@ -248,46 +256,67 @@ class ContextStore:
         with self.summary_lock:
             self.current_directive = directive
 
+    @staticmethod
+    def _expired_prefix_len(events: List[EventItem], cutoff: float) -> int:
+        """Count leading events older than cutoff (layers are in arrival order)."""
+        i = 0
+        n = len(events)
+        while i < n and events[i].timestamp < cutoff:
+            i += 1
+        return i
+
     def _manage_hierarchy_nolock(self):
+        # Runs at the top of nearly every store read, several times per tick.
+        # Layers are appended in arrival order, so expired events are always a
+        # prefix: scan only that prefix and slice, instead of rebuilding all
+        # three lists every call. When nothing has aged out this allocates
+        # nothing. Callers must hold self.lock: add_event appends to
+        # immediate in place, and off-loop readers (correlation) are
+        # consistent because they copy the layers under that same lock.
         now = time.time()
         
         # Move Immediate -> Recent
-        to_move_recent = []
-        keep_immediate = []
-        for e in self.immediate:
-            if (now - e.timestamp) > WINDOW_IMMEDIATE:
-                to_move_recent.append(e)
-            else:
-                keep_immediate.append(e)
-        self.immediate = keep_immediate
-        self.recent.extend(to_move_recent)
+        n = self._expired_prefix_len(self.immediate, now - WINDOW_IMMEDIATE)
+        if n:
+            self.recent = self.recent + self.immediate[:n]
+            self.immediate = self.immediate[n:]
 
         # Move Recent -> Background
-        to_move_background = []
-        keep_recent = []
-        for e in self.recent:
-            if (now - e.timestamp) > WINDOW_RECENT:
-                to_move_background.append(e)
-            else:
-                keep_recent.append(e)
-        self.recent = keep_recent
-        self.background.extend(to_move_background)
+        n = self._expired_prefix_len(self.recent, now - WINDOW_RECENT)
+        if n:
+            self.background = self.background + self.recent[:n]
+            self.recent = self.recent[n:]
+            self._events_version += 1
 
         # Prune Background
-        self.background = [e for e in self.background if (now - e.timestamp) <= WINDOW_BACKGROUND]
+        n = self._expired_prefix_len(self.background, now - WINDOW_BACKGROUND)
+        if n:
+            self.background = self.background[n:]
 
     def get_breadcrumbs(self, count: int = 3) -> Dict[str, Any]:
         with self.lock:
             self._manage_hierarchy_nolock()
-            active_events = self.immediate + self.recent
-            sorted_events = sorted(active_events, key=lambda e: e.score.interestingness, reverse=True)
-            
-            short_term = [{
-                "source": e.source.name, 
-                "text": e.text, 
-                "score": round(e.score.interestingness, 2), 
-                "type": "recent"
-            } for e in sorted_events[:count]]
+            cached = self._breadcrumb_cache.get(count)
+            if cached is not None and cached[0] == self._events_version:
+                short_term = cached[1]
+            else:
+                # Only the top `count` are needed — nlargest avoids a full sort.
+                top_events = heapq.nlargest(
+                    count, itertools.chain(self.immediate, self.recent),
+                    key=lambda e: e.score.interestingness
+                )
+
+                # Shared between callers until the next version bump; the
+                # endpoint only serializes it.
+                short_term = [{
+                    "source": e.source.name, 
+                    "text": e.text, 
+                    "score": round(e.score.interestingness, 2), 
+                    "type": "recent"
+                } for e in top_events]
+                if len(self._breadcrumb_cache) >= 8:
+                    self._breadcrumb_cache.clear()
+                self._breadcrumb_cache[count] = (self._events_version, short_term)
 
         with self.summary_lock:
             return {
@@ -313,6 +342,7 @@ class ContextStore:
                 for event in layer:
                     if event.id == event_id:
                         event.score = new_score
+                        self._events_version += 1
                         return True
         return False
 
@@ -379,14 +409,16 @@ class ContextStore:
     def get_stale_event_for_analysis(self) -> Optional[EventItem]:
         with self.lock:
             self._manage_hierarchy_nolock()
-            candidates = [
-                e for e in self.immediate + self.recent 
-                if 0.3 < e.score.interestingness < config.OLLAMA_TRIGGER_THRESHOLD 
-                and "sentiment" not in e.metadata 
-                and "is_bundle" not in e.metadata
-            ]
-            if not candidates: return None
-            return sorted(candidates, key=lambda e: e.timestamp, reverse=True)[0]
+            # Newest match in one pass — no list concat, no full sort.
+            threshold = config.OLLAMA_TRIGGER_THRESHOLD
+            return max(
+                (e for e in itertools.chain(self.immediate, self.recent)
+                 if 0.3 < e.score.interestingness < threshold
+                 and "sentiment" not in e.metadata
+                 and "is_bundle" not in e.metadata),
+                key=lambda e: e.timestamp,
+                default=None,
+            )
 
     # --- HOST ACTIVITY SIGNAL ---
 
@@ -436,10 +468,15 @@ class ContextStore:
             events = self.recent
             if not events: return 0.0, 0.0
 
-            chat_items = [e for e in events if e.source in [InputSource.TWITCH_CHAT, InputSource.TWITCH_MENTION]]
-            chat_velocity = len(chat_items) * 2.0
-
-            high_energy_items = [e for e in events if e.score.interestingness > 0.7]
-            stream_energy = min(len(high_energy_items) / 5.0, 1.0) 
+            # Single pass over the recent window, counting only.
+            chat_count = 0
+            high_energy_count = 0
+            for e in events:
+                if e.source in config.CHAT_SOURCES:
+                    chat_count += 1
+                if e.score.interestingness > 0.7:
+                    high_energy_count += 1
+            chat_velocity = chat_count * 2.0
+            stream_energy = min(high_energy_count / 5.0, 1.0) 
 
             return chat_velocity, stream_energy
\ No newline at end of file
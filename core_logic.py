@@ -8,7 +8,9 @@ decides what actually reaches Nami.
 """
 
 import asyncio
+import functools
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
 import config
 import services.llm_analyst as llm_analyst
@@ -105,6 +107,9 @@ async def process_engine_event(
 
     # Yield to the loop — gives socket.io PINGs and other tasks a chance.
     await asyncio.sleep(0)
+    # Classify the source once; the steps below branch on it repeatedly.
+    is_mic = source in config.MIC_SOURCES
+
     # --- DETECT DIRECT ADDRESS ---
     is_direct_address = source == config.InputSource.DIRECT_MICROPHONE
     
@@ -116,19 +121,19 @@ async def process_engine_event(
     
     if is_direct_address:
         # Tell prompt service: user spoke, clear awaiting state
-        asyncio.create_task(prompt_client.notify_user_responded())
+        spawn_background(prompt_client.notify_user_responded())
 
     
     # 2. User Profile Update
     if username:
         profile = shared.profile_manager.get_profile(username)
         shared.store.set_active_user(profile)
-    elif source in (config.InputSource.MICROPHONE, config.InputSource.DIRECT_MICROPHONE):
+    elif is_mic:
         profile = shared.profile_manager.get_profile(shared.get_current_streamer())
         shared.store.set_active_user(profile)
 
     # 3. Track conversation threads
-    if source in [config.InputSource.MICROPHONE, config.InputSource.DIRECT_MICROPHONE]:
+    if is_mic:
         detected_topic = metadata.get('topic')
         importance = metadata.get('importance', 0.5)
         
@@ -161,14 +166,14 @@ async def process_engine_event(
     shared.emit_event_scored(event)
     
     # 6. Debt Check
-    if source in [config.InputSource.MICROPHONE, config.InputSource.DIRECT_MICROPHONE]:
+    if is_mic:
         shared.behavior_engine.check_debt_resolution(shared.store, text)
 
     # 7. Event Bundling
     bundle_event_created = False
-    if source in [config.InputSource.DIRECT_MICROPHONE, config.InputSource.MICROPHONE] and heuristic_score.interestingness >= 0.6:
+    if is_mic and heuristic_score.interestingness >= 0.6:
         shared.store.set_pending_speech(event)
-    elif source not in [config.InputSource.DIRECT_MICROPHONE, config.InputSource.MICROPHONE] and heuristic_score.interestingness >= 0.7:
+    elif not is_mic and heuristic_score.interestingness >= 0.7:
         pending_speech = shared.store.get_and_clear_pending_speech(max_age_seconds=3.0)
         if pending_speech:
             bundle_text = f"User reacted with '{pending_speech.text}' to: '{event.text}'"
@@ -176,9 +181,7 @@ async def process_engine_event(
             bundle_score = EventScore(interestingness=1.0, urgency=0.9, conversational_value=1.0, topic_relevance=1.0)
             bundle_event = shared.store.add_event(event.source, bundle_text, bundle_metadata, bundle_score)
             shared.emit_event_scored(bundle_event)
-            asyncio.create_task(llm_analyst.analyze_and_update_event(
-                bundle_event, shared.store, shared.profile_manager, handle_analysis_complete
-            ))
+            _spawn_analysis(bundle_event, priority=True)
             bundle_event_created = True
 
     # 8. Attention & Analysis
@@ -186,11 +189,9 @@ async def process_engine_event(
         if is_direct_address:
             # Direct address: fast-track to analysis + send interrupt to prompt service
             print(f"🎯 [CoreLogic] Direct address - fast-tracking: {text[:50]}...")
-            asyncio.create_task(llm_analyst.analyze_and_update_event(
-                event, shared.store, shared.profile_manager, handle_analysis_complete
-            ))
+            _spawn_analysis(event, priority=True)
             # Send as interrupt — prompt service will gate it
-            asyncio.create_task(prompt_client.send_interrupt(
+            spawn_background(prompt_client.send_interrupt(
                 content=event.text,
                 source=f"DIRECTOR_{event.source.name}",
                 trigger=f"direct_{'mic' if source == config.InputSource.DIRECT_MICROPHONE else 'mention'}",
@@ -204,20 +205,53 @@ async def process_engine_event(
             attended_event = shared.behavior_engine.direct_attention(shared.store, [event])
             if attended_event:
                 if heuristic_score.interestingness >= config.OLLAMA_TRIGGER_THRESHOLD:
-                    asyncio.create_task(llm_analyst.analyze_and_update_event(
-                        event, shared.store, shared.profile_manager, handle_analysis_complete
-                    ))
+                    _spawn_analysis(event)
                 elif heuristic_score.urgency >= shared.adaptive_ctrl.current_threshold:
                     if shared.energy_system.can_afford(config.ENERGY_COST_INTERJECTION):
-                        asyncio.create_task(llm_analyst.analyze_and_update_event(
-                            event, shared.store, shared.profile_manager, handle_analysis_complete
-                        ))
+                        _spawn_analysis(event)
 
 
 def handle_analysis_complete(event: EventItem):
     shared.emit_event_scored(event)
 
 
+# Strong refs for fire-and-forget tasks (analysis, context inference,
+# monologue, prompt-service notifications, speech requests). The loop only
+# holds weak refs, so without one a pending task can be collected mid-flight
+# and the work silently never completes.
+_background_tasks: set = set()
+
+
+def spawn_background(coro, name: Optional[str] = None) -> asyncio.Task:
+    """create_task for fire-and-forget work, holding a strong ref until done."""
+    task = asyncio.create_task(coro, name=name)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def _spawn_analysis(event: EventItem, priority: bool = False) -> None:
+    """
+    Fire-and-forget LLM analysis with the backpressure check done up front.
+
+    analyze_and_update_event already drops calls beyond its pending cap, but
+    only after a Task and coroutine frame have been allocated. Checking
+    first means a burst of vision events under a saturated analyst costs
+    nothing beyond the drop counter. priority=True (bundles, direct
+    addresses) may use the analyst's reserved pending slots.
+    """
+    if llm_analyst.analysis_saturated(priority):
+        llm_analyst.note_analysis_dropped(event)
+        return
+    spawn_background(
+        llm_analyst.analyze_and_update_event(
+            event, shared.store, shared.profile_manager, handle_analysis_complete,
+            priority=priority,
+        ),
+        name=f"analyze:{event.id[:8]}",
+    )
+
+
 # --- TICKERS ---
 
 # ── Freeze-diagnostic instrumentation ─────────────────────────────────────────
@@ -280,13 +314,17 @@ async def reflex_ticker():
     The brain generates freely — the prompt service gates delivery.
     No speaking-state checks here.
     """
-    while not shared.server_ready:
-        await asyncio.sleep(0.1)
+    await shared.server_ready_event.wait()
     print("✅ Reflex ticker starting (High Frequency)")
 
     # Initialize prompt client
     await prompt_client.initialize()
 
+    # Resolved once — the shared singletons are never rebound.
+    store = shared.store
+    behavior = shared.behavior_engine
+    energy = shared.energy_system
+
     while True:
         iter_start = _time.monotonic()
         _reflex_state["iteration"] += 1
@@ -296,26 +334,26 @@ async def reflex_ticker():
             await asyncio.sleep(0)
 
             _mark_reflex_step("update_host_state")
-            shared.store.update_host_state()
+            store.update_host_state()
 
             _mark_reflex_step("update_goal")
-            shared.behavior_engine.update_goal(shared.store)
+            behavior.update_goal(store)
 
             _mark_reflex_step("get_activity_metrics")
-            chat_vel, energy_level = shared.store.get_activity_metrics()
+            chat_vel, energy_level = store.get_activity_metrics()
             shared.adaptive_ctrl.update(chat_vel, energy_level)
 
             _mark_reflex_step("generate_directive")
             directive = shared.decision_engine.generate_directive(
-                shared.store, shared.behavior_engine, shared.adaptive_ctrl, shared.energy_system
+                store, behavior, shared.adaptive_ctrl, energy
             )
-            shared.store.set_directive(directive)
+            store.set_directive(directive)
 
             # Spawn (fire-and-forget) monologue generation. This does NOT
             # block on Ollama anymore — the background task adds the event
             # to the store directly when the LLM responds.
             _mark_reflex_step("kick_monologue")
-            await shared.behavior_engine.check_internal_monologue(shared.store)
+            await behavior.check_internal_monologue(store)
 
             # Another yield before potentially CPU-heavy speech dispatcher work
             await asyncio.sleep(0)
@@ -337,7 +375,7 @@ async def reflex_ticker():
             if should_evaluate_speech:
                 _mark_reflex_step("evaluate_speech")
                 speech_decision = shared.speech_dispatcher.evaluate(
-                    shared.store, shared.behavior_engine, shared.energy_system, directive
+                    store, behavior, energy, directive
                 )
 
             if speech_decision:
@@ -345,10 +383,10 @@ async def reflex_ticker():
                 _reflex_state["last_speech_trigger_at"] = now
                 _mark_reflex_step("spend_energy")
                 # Spend energy on our side
-                shared.energy_system.spend(config.ENERGY_COST_INTERJECTION)
+                energy.spend(config.ENERGY_COST_INTERJECTION)
                 _mark_reflex_step("dispatch_speech_task")
                 # Send to prompt service (it decides whether to deliver)
-                asyncio.create_task(prompt_client.request_speech(
+                spawn_background(prompt_client.request_speech(
                     trigger=speech_decision.reason,
                     content=speech_decision.content,
                     priority=speech_decision.priority,
@@ -359,10 +397,10 @@ async def reflex_ticker():
 
             # Check callbacks
             _mark_reflex_step("check_callbacks")
-            callback_text = shared.behavior_engine.check_callbacks(shared.store)
+            callback_text = behavior.check_callbacks(store)
             if callback_text:
                 _mark_reflex_step("emit_callback_event")
-                cb_event = shared.store.add_event(
+                cb_event = store.add_event(
                     config.InputSource.INTERNAL_THOUGHT, callback_text,
                     {"type": "callback", "goal": "context_continuity"},
                     EventScore(interestingness=0.7, conversational_value=0.8)
@@ -409,8 +447,7 @@ async def heartbeat_ticker():
     """
     STUCK_THRESHOLD_S = 10.0
 
-    while not shared.server_ready:
-        await asyncio.sleep(0.5)
+    await shared.server_ready_event.wait()
     print("✅ Heartbeat starting (diagnostic, every 5s)")
 
     last_iteration = -1
@@ -530,7 +567,7 @@ def build_smart_memory_query(store, summary_data: Dict[str, Any]) -> str:
     
     recent_speech = [
         e.text for e in layers['immediate'] + layers['recent'][:2]
-        if e.source in [InputSource.MICROPHONE, InputSource.DIRECT_MICROPHONE]
+        if e.source in config.MIC_SOURCES
     ][-2:]
     
     if recent_speech:
@@ -568,79 +605,192 @@ def build_smart_memory_query(store, summary_data: Dict[str, Any]) -> str:
     print(f"🧠 [Memory Query] Final query ({len(query)} chars): '{query[:80]}...'")
     return query
 
-     
+
+@functools.lru_cache(maxsize=16)
+def _narrative_memory_entry(story: str) -> Dict[str, Any]:
+    """
+    UI memory row for one narrative segment. Segments are immutable strings
+    and the same last three are shown tick after tick, so the dict (and its
+    formatted text) is built once per segment and reused. Treat the result
+    as read-only.
+    """
+    return {
+        "source": "NARRATIVE_HISTORY",
+        "text": f"Earlier: {story}",
+        "score": 1.0,
+        "type": "narrative"
+    }
+
+
+def _build_adaptive_state(chat_vel: float, energy_level: float, scene_name: str) -> Dict[str, Any]:
+    """
+    UI-facing adaptive snapshot for director_state. Built once per summary
+    tick as a single literal; values are rounded for display here so the
+    emitter just forwards the dict.
+    """
+    ctrl = shared.adaptive_ctrl
+    return {
+        "threshold": round(ctrl.current_threshold, 2),
+        "state": ctrl.state_label,
+        "chat_velocity": round(chat_vel, 1),
+        "energy": round(energy_level, 2),
+        "social_battery": shared.energy_system.get_status(),
+        "current_goal": shared.behavior_engine.current_goal.name,
+        "current_scene": scene_name,
+    }
+
+
+# Single worker: only summary_ticker submits here, one job per tick, so the
+# CPU passes never overlap each other. The store methods they call take
+# store.lock (an RLock), so they are safe alongside the loop thread.
+_tick_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary-cpu")
+
+
+def _summary_tick_analysis(store) -> list:
+    """CPU-only part of the summary tick. Runs on _tick_executor."""
+    shared.adaptive_ctrl.process_feedback(store)
+    shared.scene_manager.update_scene(store)
+    return shared.correlation_engine.correlate(store)
+
+
+# One log line (with traceback) per phase per window. When an endpoint is
+# down the same error repeats every tick; formatting and printing it each
+# time just adds GIL-held stdout work to the loop.
+_TICK_ERROR_LOG_INTERVAL_S = 10.0
+_tick_error_last_logged: Dict[str, float] = {}
+_tick_error_suppressed: Dict[str, int] = {}
+
+
+def _tick_log_throttled(key: str) -> Optional[str]:
+    """None if key already logged this window, else the suffix to print."""
+    now = _time.monotonic()
+    if now - _tick_error_last_logged.get(key, -_TICK_ERROR_LOG_INTERVAL_S) < _TICK_ERROR_LOG_INTERVAL_S:
+        _tick_error_suppressed[key] = _tick_error_suppressed.get(key, 0) + 1
+        return None
+    _tick_error_last_logged[key] = now
+    suppressed = _tick_error_suppressed.pop(key, 0)
+    return f" (+{suppressed} suppressed)" if suppressed else ""
+
+
+def _log_tick_error(phase: str, e: Exception) -> None:
+    extra = _tick_log_throttled(phase)
+    if extra is None:
+        return
+    print(f"[Director] Error in summary ticker [{phase}]{extra}: {e}")
+    import traceback
+    traceback.print_exception(type(e), e, e.__traceback__)
+
+
 async def summary_ticker():
     global last_context_inference_time
     
-    while not shared.server_ready:
-        await asyncio.sleep(0.1)
+    await shared.server_ready_event.wait()
     print("✅ Summary ticker starting (Low Frequency)")
     await asyncio.sleep(5) 
+
+    # The shared singletons are never rebound, so resolve them once instead
+    # of re-walking shared.<name> attribute lookups every tick.
+    store = shared.store
+    add_event = store.add_event
+    pattern_source = config.InputSource.SYSTEM_PATTERN
+
+    # Deadline scheduling: each tick starts SUMMARY_INTERVAL_SECONDS after
+    # the previous one started, not after it finished, so a slow Gemini
+    # call doesn't silently stretch the cadence. A tick that runs past its
+    # slot is logged and the schedule restarts from now (no catch-up burst).
+    loop = asyncio.get_running_loop()
+    interval = config.SUMMARY_INTERVAL_SECONDS
+    deadline = loop.time()
     
     while True:
+        # Each phase is guarded on its own so one failing subsystem (an LLM
+        # endpoint down, a bad pattern) doesn't cost the rest of the cycle —
+        # director_state still reaches the UI if correlation blew up.
         try:
-            await llm_analyst.generate_summary(shared.store)
-            shared.adaptive_ctrl.process_feedback(shared.store) 
-            shared.scene_manager.update_scene(shared.store)
-            
-            patterns = shared.correlation_engine.correlate(shared.store)
+            await llm_analyst.generate_summary(store)
+        except Exception as e:
+            _log_tick_error("generate_summary", e)
+
+        # Everything this tick sends to the UI goes out as one batch at
+        # the end of the cycle (one cross-thread schedule, not N). When
+        # the hub is unreachable, skip building the payloads entirely.
+        tick_emits = []
+        ui_listening = shared.can_emit()
+
+        try:
+            # Feedback, scene scoring and correlation are pure-Python scans
+            # over the store — run them off the loop so hub I/O and HTTP
+            # handlers stay responsive while they work.
+            patterns = await loop.run_in_executor(
+                _tick_executor, _summary_tick_analysis, store
+            )
             for pat in patterns:
-                sys_event = shared.store.add_event(config.InputSource.SYSTEM_PATTERN, pat['text'], pat['metadata'], pat['score'])
-                shared.emit_event_scored(sys_event)
-
-            # --- DELETED LOCAL MEMORY DECAY & RETRIEVAL ---
-            # Decay is now handled by the Memory Service microservice!
-            
-            await shared.context_compressor.run_compression_cycle(shared.store)
-            summary_data = shared.store.get_summary_data()
-
-            print(f"🧠 [Memory] Pending saves to Hub: {len(getattr(shared.store, 'pending_memories_to_save', []))}")
-
-            # Prepare narrative history for the UI dashboard
-            # (The actual long-term memories are fetched via the /memory_stats endpoint)
-            memories_list = []
-            if shared.store.narrative_log:
-                for i, story in enumerate(reversed(shared.store.narrative_log[-3:])):
-                    memories_list.insert(i, {
-                        "source": "NARRATIVE_HISTORY", 
-                        "text": f"Earlier: {story}", 
-                        "score": 1.0, 
-                        "type": "narrative"
-                    })
-
-            chat_vel, energy_level = shared.store.get_activity_metrics()
-            
-            # --- NON-BLOCKING AI CONTEXT INFERENCE ---
+                sys_event = add_event(pattern_source, pat['text'], pat['metadata'], pat['score'])
+                if ui_listening:
+                    tick_emits.append(shared.event_scored_message(sys_event))
+        except Exception as e:
+            _log_tick_error("correlate", e)
+
+        # --- DELETED LOCAL MEMORY DECAY & RETRIEVAL ---
+        # Decay is now handled by the Memory Service microservice!
+
+        try:
+            await shared.context_compressor.run_compression_cycle(store)
+        except Exception as e:
+            _log_tick_error("compression", e)
+
+        # --- NON-BLOCKING AI CONTEXT INFERENCE ---
+        try:
             now = time.time()
             if now - last_context_inference_time >= CONTEXT_INFERENCE_INTERVAL:
                 last_context_inference_time = now
                 if not shared.is_context_locked():
                     llm_analyst.start_context_inference_task(
-                        shared.store, 
+                        store, 
                         callback=_handle_context_inference_result
                     )
-            
-            shared.emit_director_state(
-                summary=summary_data['summary'], raw_context=summary_data['raw_context'],
-                prediction=summary_data['prediction'], mood=summary_data['mood'],
-                conversation_state=summary_data['conversation_state'], flow_state=summary_data['flow'],
-                user_intent=summary_data['intent'], active_user=shared.store.active_user_profile,
-                memories=memories_list, directive=summary_data['directive'].to_dict() if summary_data['directive'] else None,
-                adaptive_state={
-                    "threshold": round(shared.adaptive_ctrl.current_threshold, 2), "state": shared.adaptive_ctrl.state_label,
-                    "chat_velocity": round(chat_vel, 1), "energy": round(energy_level, 2),
-                    "social_battery": shared.energy_system.get_status(),
-                    "current_goal": shared.behavior_engine.current_goal.name, "current_scene": summary_data['scene']
-                }
-            )
+        except Exception as e:
+            _log_tick_error("context_inference", e)
 
-            stale_event = shared.store.get_stale_event_for_analysis()
+        try:
+            summary_data = store.get_summary_data()
+
+            print(f"🧠 [Memory] Pending saves to Hub: {len(getattr(store, 'pending_memories_to_save', []))}")
+
+            if ui_listening:
+                # Prepare narrative history for the UI dashboard
+                # (The actual long-term memories are fetched via the /memory_stats endpoint)
+                # Newest narrative segment first, built in a single pass.
+                memories_list = [_narrative_memory_entry(story) for story in store.narrative_log[:-4:-1]]
+                chat_vel, energy_level = store.get_activity_metrics()
+
+                tick_emits.append(('director_state', shared.director_state_payload(
+                    summary=summary_data['summary'], raw_context=summary_data['raw_context'],
+                    prediction=summary_data['prediction'], mood=summary_data['mood'],
+                    conversation_state=summary_data['conversation_state'], flow_state=summary_data['flow'],
+                    user_intent=summary_data['intent'], active_user=store.active_user_profile,
+                    memories=memories_list, directive=summary_data['directive'].to_dict() if summary_data['directive'] else None,
+                    adaptive_state=_build_adaptive_state(chat_vel, energy_level, summary_data['scene'])
+                )))
+        except Exception as e:
+            _log_tick_error("director_state", e)
+        # Flush whatever was built, even if a later phase failed.
+        shared.emit_batch(tick_emits)
+
+        try:
+            stale_event = store.get_stale_event_for_analysis()
             if stale_event:
-                asyncio.create_task(llm_analyst.analyze_and_update_event(
-                    stale_event, shared.store, shared.profile_manager, handle_analysis_complete
-                ))
+                _spawn_analysis(stale_event)
         except Exception as e:
-            print(f"[Director] Error in summary ticker: {e}")
-            import traceback
-            traceback.print_exc()
-        await asyncio.sleep(config.SUMMARY_INTERVAL_SECONDS)
\ No newline at end of file
+            _log_tick_error("stale_analysis", e)
+
+        deadline += interval
+        slack = deadline - loop.time()
+        if slack < 0:
+            # Throttled like tick errors: a stalled LLM overruns every tick.
+            extra = _tick_log_throttled("overrun")
+            if extra is not None:
+                print(f"⏱️ [Director] Summary tick overran its {interval:.0f}s slot by {-slack:.2f}s{extra}")
+            deadline = loop.time()
+            slack = 0.0
+        await asyncio.sleep(slack)
@@ -16,13 +16,23 @@
 def _install_nonblocking_stdio():
     import os, sys, fcntl, io, time, threading
 
+    # (whole second, "[HH:MM:SS") — log bursts land within the same second,
+    # so localtime() and the clock formatting run once per second, not per line.
+    # Stored as one tuple so stdout and stderr writers never see a torn pair.
+    _ts_cache = [(None, "")]
+
     def _ts() -> str:
         # HH:MM:SS.mmm stamp captured at write-time so the launcher's read-time
         # stamp can't lie when the pipe drains in a burst.
         now = time.time()
-        local = time.localtime(now)
-        ms = int((now - int(now)) * 1000)
-        return f"[{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}.{ms:03d}] "
+        sec = int(now)
+        cached_sec, prefix = _ts_cache[0]
+        if cached_sec != sec:
+            local = time.localtime(now)
+            prefix = f"[{local.tm_hour:02d}:{local.tm_min:02d}:{local.tm_sec:02d}"
+            _ts_cache[0] = (sec, prefix)
+        ms = int((now - sec) * 1000)
+        return f"{prefix}.{ms:03d}] "
 
     class _NonBlockingWriter:
         def __init__(self, underlying, name):
@@ -99,8 +109,11 @@ _faulthandler.enable(file=_sys.stderr)
 
 import uvicorn
 import asyncio
+import random
+import time
 import uuid
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Optional
 import config
@@ -266,7 +279,10 @@ def _start_stuck_detector():
     t.start()
 # ──────────────────────────────────────────────────────────────────────────────
 
-app = FastAPI(title="Nami Director Engine")
+# orjson-backed responses for the JSON endpoints (/context returns the full
+# prompt block every speech request). The Socket.IO side already encodes via
+# orjson — see shared.sio_json.
+app = FastAPI(title="Nami Director Engine", default_response_class=ORJSONResponse)
 
 # Initialize the SensorBridge so it hooks up to the shared.sio Hub connection
 sensor_bridge = SensorBridge()
@@ -308,16 +324,28 @@ async def connect_error(data):
 # ──────────────────────────────────────────────────────────────────────────────
 
 
+_HUB_HEALTH_POLL_S = 5.0
+_HUB_TRANSPORTS = ['websocket', 'polling'] if config.HUB_ALLOW_POLLING else ['websocket']
+
+
+def _jittered(delay: float) -> float:
+    """Backoff delay scaled into [0.5x, 1x] so retries spread out."""
+    return delay * random.uniform(0.5, 1.0)
+
+
 async def connect_to_hub():
     """
     Maintain connection to the Central Hub.
 
     Reconnect strategy:
-    - Healthy: poll sio.connected every 1s
+    - Healthy: park on the disconnect/connect_error event; a 5s health poll
+      of sio.connected is only the safety net in case a handler never fires
     - Disconnect event fires → wake immediately and try to reconnect
     - Reconnect attempt: bounded by 10s timeout to prevent the await from
       hanging forever if the hub itself is wedged
-    - Failed attempt: exponential-ish backoff (2s, 4s, 8s, max 8s)
+    - Failed attempt: exponential backoff (2s, 4s, 8s, max 8s) with jitter,
+      so several services restarting against the same hub don't retry in
+      lockstep
     """
     backoff = 2.0
     while shared.server_ready:
@@ -325,7 +353,7 @@ async def connect_to_hub():
             backoff = 2.0  # reset on healthy state
             # Wait either for a disconnect signal or the next health-poll tick
             try:
-                await asyncio.wait_for(_hub_reconnect_event.wait(), timeout=1.0)
+                await asyncio.wait_for(_hub_reconnect_event.wait(), timeout=_HUB_HEALTH_POLL_S)
                 _hub_reconnect_event.clear()
             except asyncio.TimeoutError:
                 pass
@@ -335,19 +363,21 @@ async def connect_to_hub():
         try:
             print(f"🔌 [Director Engine] Connecting to Hub at {config.HUB_URL}...")
             await asyncio.wait_for(
-                shared.sio.connect(config.HUB_URL, transports=['websocket', 'polling']),
+                shared.sio.connect(config.HUB_URL, transports=_HUB_TRANSPORTS),
                 timeout=10.0,
             )
             _hub_reconnect_event.clear()
         except asyncio.TimeoutError:
-            print(f"⚠️ [Director Engine] Hub connect timed out after 10s. Retrying in {backoff:.0f}s...")
-            await asyncio.sleep(backoff)
+            delay = _jittered(backoff)
+            print(f"⚠️ [Director Engine] Hub connect timed out after 10s. Retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
             backoff = min(backoff * 2, 8.0)
         except Exception as e:
             kind = type(e).__name__
             detail = str(e) or repr(e)
-            print(f"⚠️ [Director Engine] Hub connect failed ({kind}): {detail}. Retrying in {backoff:.0f}s...")
-            await asyncio.sleep(backoff)
+            delay = _jittered(backoff)
+            print(f"⚠️ [Director Engine] Hub connect failed ({kind}): {detail}. Retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
             backoff = min(backoff * 2, 8.0)
 
 
@@ -393,6 +423,8 @@ async def get_context(payload: ContextRequest = ContextRequest()):
         with shared.store.lock:
             pending = list(shared.store.pending_memories_to_save)
             shared.store.pending_memories_to_save.clear()
+        if pending:
+            _invalidate_memory_query_cache()
         for mem in pending:
             await shared.sio.emit('save_memory', mem)
 
@@ -425,6 +457,16 @@ async def get_context(payload: ContextRequest = ContextRequest()):
     }
 
 
+# /breadcrumbs is polled by the prompt service, often several times within
+# the same instant. Answer repeats from a short per-count memo; the event
+# list itself is already version-cached in the store, this also skips the
+# summary_lock read of the scalar state fields. Bounded so arbitrary count=
+# values can't grow it.
+_BREADCRUMBS_TTL_S = 0.25
+_BREADCRUMBS_CACHE_MAX = 8
+_breadcrumbs_cache: dict = {}  # count -> (monotonic_ts, response)
+
+
 @app.get("/breadcrumbs")
 async def breadcrumbs(count: int = 5):
     """
@@ -434,7 +476,15 @@ async def breadcrumbs(count: int = 5):
     Useful for quick checks (e.g., 'has anything important happened recently?')
     before deciding whether to call /context.
     """
-    return shared.store.get_breadcrumbs(count=count)
+    now = time.monotonic()
+    hit = _breadcrumbs_cache.get(count)
+    if hit is not None and now - hit[0] < _BREADCRUMBS_TTL_S:
+        return hit[1]
+    data = shared.store.get_breadcrumbs(count=count)
+    if len(_breadcrumbs_cache) >= _BREADCRUMBS_CACHE_MAX:
+        _breadcrumbs_cache.clear()
+    _breadcrumbs_cache[count] = (now, data)
+    return data
 
 
 @app.get("/thread_stats")
@@ -478,8 +528,34 @@ def on_memory_results(data):
         # Resolve the future with the returned memories
         pending_memory_requests[req_id].set_result(data.get('memories', []))
 
+# Last memory-service answer, keyed by (query, limit). Consecutive /context
+# calls inside one summary interval usually build the same query (it is
+# derived from the current summary and recent events), so reuse
+# the reply instead of another hub round-trip. Cleared whenever we push new
+# memories to the service. Timeouts are never cached.
+# The generation is bumped on every invalidation; a fetch that was already
+# in flight when memories were saved sees it change and drops its
+# (pre-save) answer instead of caching it.
+_MEMORY_QUERY_TTL_S = config.SUMMARY_INTERVAL_SECONDS
+_memory_query_cache: Optional[tuple] = None  # (key, monotonic_ts, results)
+_memory_query_generation = 0
+
+
+def _invalidate_memory_query_cache() -> None:
+    global _memory_query_cache, _memory_query_generation
+    _memory_query_cache = None
+    _memory_query_generation += 1
+
+
 async def fetch_memories_for_prompt(query_text: str, limit: int = 5) -> list:
     """Helper to ask the memory service for context and await the reply."""
+    global _memory_query_cache
+    key = (query_text, limit)
+    cached = _memory_query_cache
+    if cached is not None and cached[0] == key and time.monotonic() - cached[1] < _MEMORY_QUERY_TTL_S:
+        return cached[2]
+
+    generation = _memory_query_generation
     req_id = str(uuid.uuid4())
     loop = asyncio.get_event_loop()
     future = loop.create_future()
@@ -495,6 +571,8 @@ async def fetch_memories_for_prompt(query_text: str, limit: int = 5) -> list:
     try:
         # Wait up to 2.5 seconds for the memory_service to reply
         results = await asyncio.wait_for(future, timeout=2.5)
+        if generation == _memory_query_generation:
+            _memory_query_cache = (key, time.monotonic(), results)
         return results
     except asyncio.TimeoutError:
         print("⚠️ [Memory] Query timed out. Memory service might be offline.")
@@ -521,8 +599,23 @@ async def store_stats():
 
 # --- Server Boot ---
 
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Build the engine's event loop. Prefers uvloop (libuv, C scheduler and
+    socket I/O) when installed; falls back to the stdlib selector loop on
+    Windows or if the wheel is missing. run_server builds the loop itself
+    before handing it to uvicorn, so uvicorn's own loop= setting never
+    applies here.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
 def run_server():
-    loop = asyncio.new_event_loop()
+    loop = _new_event_loop()
     asyncio.set_event_loop(loop)
     shared.ui_event_loop = loop
 
@@ -531,15 +624,18 @@ def run_server():
 
     # Boot up background tasks
     loop.run_until_complete(llm_analyst.create_http_client())
-    loop.create_task(connect_to_hub())
-    loop.create_task(core_logic.summary_ticker())
-    loop.create_task(core_logic.reflex_ticker())
-    loop.create_task(core_logic.heartbeat_ticker())
+    background_tasks = [
+        loop.create_task(connect_to_hub()),
+        loop.create_task(core_logic.summary_ticker()),
+        loop.create_task(core_logic.reflex_ticker()),
+        loop.create_task(core_logic.heartbeat_ticker()),
+    ]
     core_logic.start_thread_watchdog()
     _start_file_heartbeat()
     _start_stuck_detector()
 
     shared.server_ready = True
+    shared.server_ready_event.set()
     print("✅ Director Engine is READY")
     print(f"   /context      → Full structured context for prompt service")
     print(f"   /breadcrumbs  → Lightweight recent event poll")
@@ -559,8 +655,31 @@ def run_server():
     try:
         loop.run_until_complete(server.serve())
     finally:
+        _shutdown_background_tasks(loop)
         loop.close()
 
 
+def _shutdown_background_tasks(loop: asyncio.AbstractEventLoop, timeout: float = 2.0) -> None:
+    """
+    Cancel every task still on the loop at once and wait on the whole set
+    with a single timeout. Shutdown latency is max-of-tasks, not
+    sum-of-timeouts. This covers the tickers and hub connection as well as
+    fire-and-forget work (core_logic.spawn_background) and the emit drain,
+    so the loop doesn't close with pending tasks still attached.
+    """
+    shared.server_ready = False
+    pending = {t for t in asyncio.all_tasks(loop) if not t.done()}
+    for t in pending:
+        t.cancel()
+    try:
+        if pending:
+            loop.run_until_complete(asyncio.wait(pending, timeout=timeout))
+        loop.run_until_complete(llm_analyst.close_http_client())
+    except Exception as e:
+        print(f"⚠️ [Director Engine] Shutdown cleanup error: {type(e).__name__}: {e}")
+    # Don't block exit on a tick pass that is still running.
+    core_logic._tick_executor.shutdown(wait=False, cancel_futures=True)
+
+
 if __name__ == "__main__":
     run_server()
\ No newline at end of file
@@ -1,10 +1,11 @@
 # Save as: director_engine/scoring.py
-import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, Any
-from config import InputSource
+from config import InputSource, HIGH_URGENCY_SOURCES, CONVERSATIONAL_SOURCES
 
-@dataclass
+# slots: one of these hangs off every stored event and its fields are read
+# on every scan (breadcrumbs, correlation, activity metrics).
+@dataclass(slots=True)
 class EventScore:
     interestingness: float = 0.0
     urgency: float = 0.0
@@ -53,7 +54,7 @@ def calculate_event_score(
 
     # 2. Urgency (Heuristic based on source)
     urgency = 0.1
-    if source in [InputSource.DIRECT_MICROPHONE, InputSource.TWITCH_MENTION]:
+    if source in HIGH_URGENCY_SOURCES:
         urgency = 0.9
     elif source == InputSource.MICROPHONE:
         urgency = 0.6
@@ -62,7 +63,7 @@ def calculate_event_score(
 
     # 3. Conversational Value (Heuristic)
     conv_value = 0.2
-    if source in [InputSource.DIRECT_MICROPHONE, InputSource.MICROPHONE, InputSource.TWITCH_CHAT]:
+    if source in CONVERSATIONAL_SOURCES:
         conv_value = 0.7
     if len(str(metadata.get('text', ''))) > 10: # Slightly more value if it's not empty
         conv_value += 0.1
@@ -18,7 +18,7 @@ from config import (
     OLLAMA_TIMEOUT_SUMMARY, OLLAMA_TIMEOUT_CTX_INFER,
     INTERJECTION_THRESHOLD, InputSource,
     ConversationState, FlowState, UserIntent,
-    OWNER_STREAMER_ID, GEMINI_API_KEY
+    GEMINI_API_KEY
 )
 from context.context_store import ContextStore, EventItem
 from context.user_profile_manager import UserProfileManager
@@ -58,6 +58,10 @@ MEMORY_PROMOTION_THRESHOLD = 0.70
 #   store via heuristic scoring upstream.
 _ANALYZE_MAX_CONCURRENT = 2
 _ANALYZE_MAX_PENDING = 4
+# PRIORITY_RESERVE: extra pending slots only bundle / direct-address events
+#   may use, so a backlog of routine vision analyses can't crowd out the
+#   events most likely to warrant an interjection.
+_ANALYZE_PRIORITY_RESERVE = 2
 _analyze_sem: Optional[asyncio.Semaphore] = None
 _analyze_pending = 0
 _analyze_dropped_total = 0
@@ -70,13 +74,30 @@ def _get_analyze_sem() -> asyncio.Semaphore:
         _analyze_sem = asyncio.Semaphore(_ANALYZE_MAX_CONCURRENT)
     return _analyze_sem
 
+# Connection pool for the Ollama client. httpx's default keepalive_expiry
+# is 5s, so the localhost socket was torn down between analysis bursts and
+# every burst paid a fresh connect. Keep it warm across idle gaps, and size
+# the pool for the analysis semaphore plus thought / context-inference
+# calls. Ollama only speaks HTTP/1.1, so HTTP/2 multiplexing isn't
+# available; per-call deadlines stay on asyncio.wait_for, and only connect
+# gets an httpx timeout so a dead Ollama fails fast.
+_OLLAMA_HTTP_LIMITS = httpx.Limits(
+    max_connections=8, max_keepalive_connections=8, keepalive_expiry=60.0
+)
+_OLLAMA_HTTP_TIMEOUT = httpx.Timeout(None, connect=5.0)
+
+
 async def create_http_client():
     global http_client, ollama_client, gemini_summary_model
     if http_client is None:
-        http_client = httpx.AsyncClient()
+        http_client = httpx.AsyncClient(limits=_OLLAMA_HTTP_LIMITS)
     if ollama_client is None:
         try:
-            ollama_client = ollama.AsyncClient(host=OLLAMA_HOST)
+            ollama_client = ollama.AsyncClient(
+                host=OLLAMA_HOST,
+                timeout=_OLLAMA_HTTP_TIMEOUT,
+                limits=_OLLAMA_HTTP_LIMITS,
+            )
             print(f"[Analyst] ✅ Async Ollama Client connected at {OLLAMA_HOST}")
         except Exception as e:
             print(f"[Analyst] ❌ Failed to connect to Ollama: {e}")
@@ -282,7 +303,11 @@ def start_context_inference_task(store: ContextStore, callback: Callable[[Dict[s
         if result and callback:
             callback(result)
 
-    asyncio.create_task(_task())
+    # spawn_background holds a ref: if the task were collected mid-flight,
+    # the finally that clears _context_inference_running would never run.
+    # Lazy import avoids circular dependency at module-load time.
+    import core_logic as _cl
+    _cl.spawn_background(_task(), name="context_inference")
 
 
 # --- Analysis ---
@@ -362,27 +387,39 @@ def parse_llm_response(response_text: str) -> Tuple[EventScore | None, str | Non
         return None, None, None, []
 
 
+def analysis_saturated(priority: bool = False) -> bool:
+    """True when analyze_and_update_event would drop a new call outright."""
+    limit = _ANALYZE_MAX_PENDING + (_ANALYZE_PRIORITY_RESERVE if priority else 0)
+    return _analyze_pending >= limit
+
+
+def note_analysis_dropped(event: EventItem) -> None:
+    global _analyze_dropped_total
+    _analyze_dropped_total += 1
+    # Log every drop initially, then sample (mod 10) to avoid log spam during sustained load
+    if _analyze_dropped_total <= 5 or _analyze_dropped_total % 10 == 0:
+        print(
+            f"⚠️  [Analyst] DROPPED analysis for event {event.id} "
+            f"({_analyze_pending} pending, {_analyze_dropped_total} total dropped) "
+            f"— backpressure active"
+        )
+
+
 async def analyze_and_update_event(
     event: EventItem,
     store: ContextStore,
     profile_manager: UserProfileManager,
-    emit_callback: Callable[[EventItem], None] | None = None
+    emit_callback: Callable[[EventItem], None] | None = None,
+    priority: bool = False,
 ):
     if not ollama_client: return
 
-    global _analyze_pending, _analyze_dropped_total
+    global _analyze_pending
 
     # Backpressure: drop if already saturated. Prevents create_task callers
     # from piling up unbounded when ollama can't keep up with vision events.
-    if _analyze_pending >= _ANALYZE_MAX_PENDING:
-        _analyze_dropped_total += 1
-        # Log every drop initially, then sample (mod 10) to avoid log spam during sustained load
-        if _analyze_dropped_total <= 5 or _analyze_dropped_total % 10 == 0:
-            print(
-                f"⚠️  [Analyst] DROPPED analysis for event {event.id} "
-                f"({_analyze_pending} pending, {_analyze_dropped_total} total dropped) "
-                f"— backpressure active"
-            )
+    if analysis_saturated(priority):
+        note_analysis_dropped(event)
         return
 
     _analyze_pending += 1
@@ -524,6 +561,44 @@ def _filter_for_summary(events: List[EventItem]) -> List[EventItem]:
     return [e for e in events if e.source in _SUMMARY_INPUT_SOURCES]
 
 
+# Static instructions, built once. They come first and the per-tick
+# EVIDENCE block comes last, so consecutive summary calls share an identical
+# prompt prefix the provider can serve from its prefix cache, and we don't
+# re-join the enum option lists every tick.
+_SUMMARY_PROMPT_PREFIX = f"""You are a situation summarizer for a Twitch streaming AI.
+
+Your job is to describe what is CURRENTLY observable, grounded strictly in the
+events listed in the EVIDENCE section at the end of this prompt. You are not a
+writer, a comedian, or a storyteller.
+
+HARD RULES — these override any creative instinct:
+1. Use ONLY information present in the EVIDENCE events. Do not infer entities,
+   characters, objects, locations, emotions, or events that are not stated.
+2. IMMEDIATE EVENTS are ground truth for the current state. If IMMEDIATE
+   contradicts BACKGROUND, IMMEDIATE wins (e.g. if BACKGROUND said oxygen
+   was low and IMMEDIATE says oxygen is 75%, the current state is 75%).
+3. BACKGROUND is historical context only. Never lead a summary with it.
+   Never use it as the "current" situation.
+4. If IMMEDIATE is "(empty)", the current state is unknown. Say so plainly
+   ("No new activity in the last 10 seconds; last observed: ...") rather than
+   inventing detail.
+5. If ALL THREE layers are "(empty)", set summary to exactly:
+   "(No current activity observed.)"
+6. Do not echo or extend any prior commentary. You have not been shown
+   Nami's previous replies for a reason — do not invent them either.
+7. No metaphors, no jokes, no "vibe" descriptions. Describe what is on screen
+   or in the audio, factually. Other components handle the personality layer.
+
+Produce one JSON object with these fields:
+- summary: 1-2 sentences. Plain factual description of current state.
+- prediction: 1 sentence. What might happen next, based only on evidence.
+  Use "Unknown" if there is no basis for a prediction.
+- conversation_state: one of [{", ".join(s.name for s in ConversationState)}]
+- flow_state: one of [{", ".join(s.name for s in FlowState)}]
+- user_intent: one of [{", ".join(s.name for s in UserIntent)}]
+"""
+
+
 def build_summary_prompt(layers: Dict[str, List[EventItem]]) -> Tuple[str, str, int]:
     """
     Returns (raw_context_for_storage, llm_prompt, total_event_count).
@@ -559,40 +634,7 @@ def build_summary_prompt(layers: Dict[str, List[EventItem]]) -> Tuple[str, str,
 {format_layer(background)}
 """
 
-    prompt = f"""You are a situation summarizer for a Twitch streaming AI.
-
-Your job is to describe what is CURRENTLY observable, grounded strictly in the
-events listed below. You are not a writer, a comedian, or a storyteller.
-
-EVIDENCE:
-{raw_context}
-
-HARD RULES — these override any creative instinct:
-1. Use ONLY information present in the events above. Do not infer entities,
-   characters, objects, locations, emotions, or events that are not stated.
-2. IMMEDIATE EVENTS are ground truth for the current state. If IMMEDIATE
-   contradicts BACKGROUND, IMMEDIATE wins (e.g. if BACKGROUND said oxygen
-   was low and IMMEDIATE says oxygen is 75%, the current state is 75%).
-3. BACKGROUND is historical context only. Never lead a summary with it.
-   Never use it as the "current" situation.
-4. If IMMEDIATE is "(empty)", the current state is unknown. Say so plainly
-   ("No new activity in the last 10 seconds; last observed: ...") rather than
-   inventing detail.
-5. If ALL THREE layers are "(empty)", set summary to exactly:
-   "(No current activity observed.)"
-6. Do not echo or extend any prior commentary. You have not been shown
-   Nami's previous replies for a reason — do not invent them either.
-7. No metaphors, no jokes, no "vibe" descriptions. Describe what is on screen
-   or in the audio, factually. Other components handle the personality layer.
-
-Produce one JSON object with these fields:
-- summary: 1-2 sentences. Plain factual description of current state.
-- prediction: 1 sentence. What might happen next, based only on evidence above.
-  Use "Unknown" if there is no basis for a prediction.
-- conversation_state: one of [{", ".join(s.name for s in ConversationState)}]
-- flow_state: one of [{", ".join(s.name for s in FlowState)}]
-- user_intent: one of [{", ".join(s.name for s in UserIntent)}]
-"""
+    prompt = f"{_SUMMARY_PROMPT_PREFIX}\nEVIDENCE:\n{raw_context}"
     return raw_context, prompt, total
 
 
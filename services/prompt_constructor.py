@@ -1,5 +1,5 @@
 # Save as: director_engine/services/prompt_constructor.py
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any
 import re
 import asyncio
 import google.generativeai as genai # type: ignore
@@ -8,8 +8,27 @@ from config import ConversationState, FlowState, InputSource, GEMINI_API_KEY
 from context.context_store import ContextStore, EventItem
 from services.structured_prompt_formatter import StructuredPromptFormatter
 from systems.decision_engine import Directive
-from typing import Dict, Any, List
-from config import SceneType, FlowState, ConversationState
+from config import SceneType
+
+# Strips common AI filler phrases from vision descriptions. Compiled once;
+# _format_visual_summary runs on every context build.
+_AI_FILLER_RE = re.compile(
+    r"^(Okay, let's (describe|analyze|break down) (what's going on in this image|this image|this image:)|"
+    r"Here's the screen content analysis:|Alright, here's the rundown of what I'm seeing:|It's a cartoon still, focusing on|"
+    r"Alright, let's break it down:|Alright, let's analyze this image:|This is a cartoon still|"
+    r"The limited color palette|\* This is a cartoon frame featuring|\* It's a cartoon frame showing|"
+    r"The composition (keeps|focuses on)|Here's the screen content analysis:|Okay, this looks like a shot from an animated series\.)\s*",
+    flags=re.IGNORECASE
+)
+
+
+# Narrative preambles, applied in order by _clean_narrative_entry (each one
+# strips after the previous, so they stay separate patterns).
+_NARRATIVE_PREAMBLE_RES = tuple(re.compile(p, re.IGNORECASE) for p in (
+    r"^Here's a summary.*?:", r"^In this clip.*?:", r"^The memorable moment is:?\s*",
+    r"^Memorable moment:?\s*", r"^One memorable moment:?\s*", r"^Previously:?\s*", r"^Earlier:?\s*",
+))
+
 
 class PromptConstructor:
     """
@@ -169,19 +188,9 @@ class PromptConstructor:
         """
         visual_events_text = []
         
-        # Regex to strip common AI filler phrases
-        ai_filler_regex = re.compile(
-            r"^(Okay, let's (describe|analyze|break down) (what's going on in this image|this image|this image:)|"
-            r"Here's the screen content analysis:|Alright, here's the rundown of what I'm seeing:|It's a cartoon still, focusing on|"
-            r"Alright, let's break it down:|Alright, let's analyze this image:|This is a cartoon still|"
-            r"The limited color palette|\* This is a cartoon frame featuring|\* It's a cartoon frame showing|"
-            r"The composition (keeps|focuses on)|Here's the screen content analysis:|Okay, this looks like a shot from an animated series\.)\s*", 
-            flags=re.IGNORECASE
-        )
-
         for e in events:
             if e.source == InputSource.VISUAL_CHANGE:
-                cleaned_text = ai_filler_regex.sub("", e.text).strip()
+                cleaned_text = _AI_FILLER_RE.sub("", e.text).strip()
                 if cleaned_text:
                      visual_events_text.append(cleaned_text)
         
@@ -349,12 +358,8 @@ class PromptConstructor:
     
     def _clean_narrative_entry(self, entry: str) -> str:
         clean_entry = entry
-        preambles = [
-            r"^Here's a summary.*?:", r"^In this clip.*?:", r"^The memorable moment is:?\s*",
-            r"^Memorable moment:?\s*", r"^One memorable moment:?\s*", r"^Previously:?\s*", r"^Earlier:?\s*",
-        ]
-        for pattern in preambles:
-            clean_entry = re.sub(pattern, "", clean_entry, flags=re.IGNORECASE).strip()
+        for pattern in _NARRATIVE_PREAMBLE_RES:
+            clean_entry = pattern.sub("", clean_entry).strip()
         if clean_entry.startswith('"') and clean_entry.endswith('"'): clean_entry = clean_entry[1:-1]
         if clean_entry.startswith("'") and clean_entry.endswith("'"): clean_entry = clean_entry[1:-1]
         return clean_entry.strip()
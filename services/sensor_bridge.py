@@ -15,6 +15,7 @@ Each socket IS the source — no inference needed.
 import asyncio
 import re
 import time
+from typing import Optional
 from pydantic import BaseModel
 from config import InputSource
 import shared
@@ -26,7 +27,7 @@ class EventPayload(BaseModel):
     source_str: str
     text: str
     metadata: dict = {}
-    username: str = None
+    username: Optional[str] = None
 
 
 # ---------------------------------------------------------------------------
@@ -44,8 +45,19 @@ def _extract_text(payload: dict, *keys) -> str:
     return ""
 
 
+# Plain dict lookup instead of InputSource[...] so an unknown source_str is
+# a None check rather than a raised-and-caught KeyError.
+_SOURCE_BY_NAME = {s.name: s for s in InputSource}
+
+
+# Silence markers are short, so longer payloads (most of them) are rejected
+# on length alone without lowercasing a copy of the whole transcript.
+_SILENCE_TOKENS = frozenset({"[silence]", "none", "n/a", "silence", ""})
+_SILENCE_MAX_LEN = max(len(t) for t in _SILENCE_TOKENS)
+
+
 def _is_silence(text: str) -> bool:
-    return text.lower() in {"[silence]", "none", "n/a", "silence", ""}
+    return len(text) <= _SILENCE_MAX_LEN and text.lower() in _SILENCE_TOKENS
 
 
 # ---------------------------------------------------------------------------
@@ -164,7 +176,7 @@ class SensorBridge:
                     shared.store.thread_manager.track_nami_response(
                         text=reply_text, resolves_thread=resolves
                     )
-                asyncio.create_task(prompt_client.notify_bot_response())
+                core_logic.spawn_background(prompt_client.notify_bot_response())
             except Exception as e:
                 print(f"⚠️ [SensorBridge] Error handling bot_reply: {e}")
 
@@ -199,9 +211,16 @@ class SensorBridge:
         @shared.sio.on("event")
         async def ingest_event(payload: dict):
             try:
-                model = EventPayload(**payload)
+                # Hub payloads are external input, so they stay validated —
+                # model_validate takes the dict straight into pydantic-core
+                # without the **kwargs repack.
+                model = EventPayload.model_validate(payload)
+                source = _SOURCE_BY_NAME.get(model.source_str)
+                if source is None:
+                    print(f"⚠️ [SensorBridge] Invalid event payload: unknown source {model.source_str!r}")
+                    return
                 await self.callback(
-                    InputSource[model.source_str],
+                    source,
                     model.text,
                     model.metadata,
                     model.username,
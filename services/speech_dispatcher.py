@@ -9,7 +9,6 @@ No speaking state tracking, no HTTP client, no cooldowns here.
 The prompt service gates everything.
 """
 
-import time
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
@@ -18,10 +17,9 @@ from config import (
     InputSource,
     BotGoal,
     FlowState,
-    ConversationState,
     SceneType,
 )
-from context.context_store import ContextStore, EventItem
+from context.context_store import ContextStore
 from systems.decision_engine import Directive
 from systems.energy_system import EnergySystem
 from systems.behavior_engine import BehaviorEngine
@@ -1,11 +1,17 @@
 # PRIORITY 3: Structured Prompt Format
 # This provides a clean, parseable XML-like format for better LLM understanding
 
+import re
 from typing import List, Dict, Any, Optional
-from config import InputSource, SceneType
 from context.context_store import ContextStore, EventItem
 from systems.decision_engine import Directive
 
+# Leading AI preamble stripped from memory / narrative text in _clean_text.
+_PREAMBLE_RE = re.compile(
+    r"^(Here's|Here is|The memorable moment is|Memorable moment:|Earlier:|Previously:)\s*:?\s*",
+    flags=re.IGNORECASE
+)
+
 
 class StructuredPromptFormatter:
     """
@@ -36,6 +42,14 @@ class StructuredPromptFormatter:
             'conversation_log',
             'memories',
         ]
+
+        # Last rendered <callback_material> block and the content it was
+        # built from. The memory service reply is cached per summary
+        # interval and the narrative/ancient logs change only on
+        # compression, so consecutive /context builds usually render the
+        # exact same block — reuse the string (byte-identical, which also
+        # keeps downstream prompt prefixes stable).
+        self._memory_block_cache: Optional[tuple] = None  # (key, text)
     
     def format_full_prompt(
         self,
@@ -260,11 +274,34 @@ class StructuredPromptFormatter:
         store: ContextStore
     ) -> str:
         """Format memories with callback hints."""
+        ancient = store.ancient_history_log[-2:]  # Last 2
+        narrative = store.narrative_log[-3:]  # Last 3
+        top_memories = memories[:3] if memories else []
+        key = (
+            tuple(ancient),
+            tuple(narrative),
+            tuple(mem.get('memory_text') or mem.get('text', '') for mem in top_memories),
+            store.current_scene,  # callback hints depend on the scene
+        )
+        cached = self._memory_block_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        text = self._render_memories(ancient, narrative, top_memories, store)
+        self._memory_block_cache = (key, text)
+        return text
+
+    def _render_memories(
+        self,
+        ancient: List[str],
+        narrative: List[str],
+        memories: List[Dict[str, Any]],
+        store: ContextStore
+    ) -> str:
         lines = []
         
         # Ancient history (oldest)
-        if store.ancient_history_log:
-            ancient = store.ancient_history_log[-2:]  # Last 2
+        if ancient:
             lines.append("  <ancient_history>")
             for entry in ancient:
                 clean = self._clean_text(entry)
@@ -272,8 +309,7 @@ class StructuredPromptFormatter:
             lines.append("  </ancient_history>")
         
         # Narrative history (recent stream events)
-        if store.narrative_log:
-            narrative = store.narrative_log[-3:]  # Last 3
+        if narrative:
             lines.append("  <recent_stream_events>")
             for entry in narrative:
                 clean = self._clean_text(entry)
@@ -283,7 +319,7 @@ class StructuredPromptFormatter:
         # Semantic memories (relevant moments)
         if memories:
             lines.append("  <relevant_moments>")
-            for mem in memories[:3]:  # Top 3
+            for mem in memories:  # Top 3 (sliced by caller)
                 # NEW: Safely get the text out of the dictionary
                 content = mem.get('memory_text') or mem.get('text', '')
                 clean = self._clean_text(content)
@@ -304,30 +340,6 @@ class StructuredPromptFormatter:
 {content}
 </callback_material>"""
 
-    def _generate_callback_hint(self, mem: Dict[str, Any], store: ContextStore) -> Optional[str]:
-        """Suggest when to bring up a memory."""
-        # NEW: Safely get the text out of the dictionary
-        text = (mem.get('memory_text') or mem.get('text', '')).lower()
-        
-        # Pattern matching for callback opportunities
-        if any(word in text for word in ["died", "failed", "lost", "game over"]):
-            return "Use when: User fails again / Skill issue"
-        
-        elif any(word in text for word in ["won", "beat", "victory", "success"]):
-            return "Use when: User wins / Celebrating"
-        
-        elif "chat" in text and any(word in text for word in ["said", "asked", "told"]):
-            return "Use when: Similar chat interaction"
-        
-        elif store.current_scene.name.lower() in text:
-            return "Use when: Same scene/game"
-        
-        elif any(word in text for word in ["funny", "laugh", "joke"]):
-            return "Use when: Comedy moment"
-        
-        return None
-
-
     def _generate_callback_hint(self, mem: Dict[str, Any], store: ContextStore) -> Optional[str]:
         """Suggest when to bring up a memory."""
         text = (mem.get('memory_text') or mem.get('text', '')).lower()
@@ -352,15 +364,8 @@ class StructuredPromptFormatter:
     
     def _clean_text(self, text: str) -> str:
         """Remove AI preambles and clean text."""
-        import re
-        
         # Remove common AI filler
-        text = re.sub(
-            r"^(Here's|Here is|The memorable moment is|Memorable moment:|Earlier:|Previously:)\s*:?\s*",
-            "",
-            text,
-            flags=re.IGNORECASE
-        )
+        text = _PREAMBLE_RE.sub("", text)
         
         # Remove quotes if wrapped
         text = text.strip()
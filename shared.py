@@ -8,12 +8,13 @@ The brain no longer tracks whether Nami is speaking.
 """
 
 import asyncio
+import collections
 import json
+import orjson
 import socketio
-import time
-import traceback
+import threading
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Any, List, Optional, Tuple
 import config
 from context.context_store import ContextStore, EventItem
 from context.user_profile_manager import UserProfileManager
@@ -27,10 +28,43 @@ from systems.decision_engine import DecisionEngine
 from services.prompt_constructor import PromptConstructor
 from services.speech_dispatcher import SpeechDispatcher
 
+# --- SOCKET.IO JSON CODEC ---
+# python-socketio encodes every packet through a pluggable `json` module.
+# orjson is C-implemented and several times faster than stdlib json on the
+# director_state payload we push every tick.
+class _OrjsonCodec:
+    """Minimal json-module shim for python-socketio backed by orjson."""
+
+    @staticmethod
+    def dumps(obj, **kwargs) -> str:
+        # socketio passes separators=...; orjson output is already compact.
+        # No default=: orjson handles Enum/datetime/dataclass natively, and
+        # anything else should fail loudly like stdlib json did rather
+        # than reach the UI as a repr string.
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(s, **kwargs):
+        return orjson.loads(s)
+
+
+sio_json = _OrjsonCodec
+
+# event_scored is the highest-rate emit; optionally sent as a binary msgpack
+# attachment (see config.EVENT_SCORED_MSGPACK).
+try:
+    import msgpack as _msgpack
+except ImportError:
+    _msgpack = None
+
 # --- GLOBAL SINGLETONS ---
-sio = socketio.AsyncClient(reconnection=True, reconnection_attempts=0, reconnection_delay=2)
+sio = socketio.AsyncClient(
+    reconnection=True, reconnection_attempts=0, reconnection_delay=2, json=sio_json
+)
 ui_event_loop: Optional[asyncio.AbstractEventLoop] = None
 server_ready: bool = False
+# Set alongside server_ready so tickers can park on it instead of polling.
+server_ready_event = asyncio.Event()
 
 # --- DIRECTOR MANUAL CONTEXT (defaults; overridden by _load_director_state) ---
 manual_context: str = ""
@@ -59,8 +93,8 @@ def _save_director_state() -> None:
 
 def _load_director_state() -> None:
     global manual_context, current_streamer, streamer_locked, context_locked
-    if not _STATE_FILE.exists():
-        return
+    # One open() instead of exists() + open(): a missing file is the common
+    # first-boot case and is handled by FileNotFoundError below.
     try:
         data = json.loads(_STATE_FILE.read_text())
         manual_context = data.get("manual_context", manual_context) or ""
@@ -70,6 +104,8 @@ def _load_director_state() -> None:
         print(f"💾 [Director] Restored state: streamer={current_streamer!r} "
               f"(locked={streamer_locked}), context={'set' if manual_context else 'empty'} "
               f"(locked={context_locked})")
+    except FileNotFoundError:
+        return
     except Exception as e:
         print(f"⚠️ [Director] Failed to load persisted state: {e}")
 
@@ -141,40 +177,159 @@ prompt_constructor = PromptConstructor()
 speech_dispatcher = SpeechDispatcher()
 
 # --- EMITTERS ---
-def _emit_threadsafe(event: str, data: dict):
-    """Thread-safe emit with better error handling."""
-    global ui_event_loop, server_ready, sio
-    
-    if not server_ready:
-        return
-        
-    if ui_event_loop is None:
-        return
-        
-    try:
-        if ui_event_loop.is_closed():
+def can_emit() -> bool:
+    """True when the loop is up and the hub connection can carry an emit."""
+    # Runs before every emit, from any thread: one local read of the loop
+    # reference and plain boolean checks, no global declarations or
+    # exception frame (is_closed() doesn't raise).
+    loop = ui_event_loop
+    if not server_ready or loop is None or loop.is_closed():
+        return False
+
+    # Every UI emit is relayed through the hub. While disconnected, sio.emit
+    # would only raise inside the scheduled coroutine, so skip building and
+    # scheduling it at all.
+    return sio.connected
+
+
+# Cross-thread emit queue. Producers append and, only if no drain is
+# already pending, wake the loop once with call_soon_threadsafe. The drain
+# task empties the deque and awaits each sio.emit in order. A burst of N
+# emits costs one wakeup and no concurrent.futures.Future allocations,
+# instead of N run_coroutine_threadsafe round-trips.
+_emit_queue: collections.deque = collections.deque()
+_emit_drain_lock = threading.Lock()
+_emit_drain_scheduled = False
+
+
+def _enqueue_emits(items) -> None:
+    global _emit_drain_scheduled
+    _emit_queue.extend(items)
+    with _emit_drain_lock:
+        if _emit_drain_scheduled:
             return
-    except Exception:
+        _emit_drain_scheduled = True
+    # Most emits come from coroutines already running on ui_event_loop
+    # (sensor handlers, tickers). There, start the drain directly and skip
+    # call_soon_threadsafe's self-pipe wakeup.
+    try:
+        on_loop = asyncio.get_running_loop() is ui_event_loop
+    except RuntimeError:
+        on_loop = False
+    if on_loop:
+        _start_emit_drain()
         return
-    
     try:
-        future = asyncio.run_coroutine_threadsafe(sio.emit(event, data), ui_event_loop)
+        ui_event_loop.call_soon_threadsafe(_start_emit_drain)
     except RuntimeError as e:
+        with _emit_drain_lock:
+            _emit_drain_scheduled = False
+        _emit_queue.clear()
         if "closed" not in str(e).lower() and server_ready:
-            print(f"⚠️ UI Emit Error ({event}): {e}")
-    except Exception as e:
-        if server_ready:
-            print(f"⚠️ UI Emit Error ({event}): {type(e).__name__}: {e}")
+            print(f"⚠️ UI Emit Error: {e}")
 
-def emit_event_scored(event: EventItem):
-    _emit_threadsafe('event_scored', {
-        'score': event.score.interestingness, 
-        'scores': event.score.to_dict(),
+
+_emit_drain_task: Optional[asyncio.Task] = None
+
+
+def _start_emit_drain() -> None:
+    # Hold a strong reference — the loop only keeps weak refs to tasks.
+    global _emit_drain_task
+    _emit_drain_task = ui_event_loop.create_task(_drain_emit_queue())
+
+
+# Full-state snapshots: when several are queued, only the newest is worth
+# sending. Everything else (event_scored etc.) is delivered one-for-one.
+_LATEST_WINS_EVENTS = frozenset({'director_state'})
+
+
+def _take_emit_batch() -> List[Tuple[str, Any]]:
+    """Pop everything queued so far, dropping superseded state snapshots."""
+    batch = []
+    popleft = _emit_queue.popleft
+    while _emit_queue:
+        batch.append(popleft())
+    if len(batch) > 1:
+        seen = set()
+        kept = []
+        for event, data in reversed(batch):
+            if event in _LATEST_WINS_EVENTS:
+                if event in seen:
+                    continue
+                seen.add(event)
+            kept.append((event, data))
+        kept.reverse()
+        batch = kept
+    return batch
+
+
+_emit_errors_total = 0
+
+
+async def _drain_emit_queue():
+    global _emit_drain_scheduled, _emit_errors_total
+    while True:
+        for event, data in _take_emit_batch():
+            try:
+                await sio.emit(event, data)
+            except Exception as e:
+                _emit_errors_total += 1
+                # Sampled like the analyst's drop log: a hub hiccup fails
+                # every queued emit at once and shouldn't flood stdout.
+                if server_ready and (_emit_errors_total <= 5 or _emit_errors_total % 50 == 0):
+                    print(f"⚠️ UI Emit Error ({event}): {type(e).__name__}: {e} "
+                          f"({_emit_errors_total} total)")
+        with _emit_drain_lock:
+            if not _emit_queue:
+                _emit_drain_scheduled = False
+                return
+
+
+def _emit_threadsafe(event: str, data: Any):
+    """Thread-safe emit. Queued and sent in order by the loop-side drain."""
+    if not can_emit():
+        return
+    _enqueue_emits(((event, data),))
+
+
+def emit_batch(items: List[Tuple[str, dict]]):
+    """
+    Queue several (event, data) pairs in one go.
+
+    The summary tick produces a pattern event or two plus director_state
+    every cycle; they share a single drain wakeup and the hub still
+    receives the ordinary per-event messages in order.
+    """
+    if not items or not can_emit():
+        return
+    _enqueue_emits(items)
+
+
+# Enum .name goes through a descriptor on every access; this is read once
+# per scored event, so resolve it through a plain dict instead.
+_SOURCE_NAMES = {s: s.name for s in config.InputSource}
+
+
+def event_scored_payload(event: EventItem) -> dict:
+    score = event.score
+    return {
+        'score': score.interestingness, 
+        'scores': score.to_dict(),
         'timestamp': event.timestamp,
         'text': event.text,
-        'source': event.source.name,
+        'source': _SOURCE_NAMES[event.source],
         'id': event.id 
-    })
+    }
+
+def event_scored_message(event: EventItem) -> Tuple[str, Any]:
+    """(event_name, data) for one scored event, JSON or msgpack per config."""
+    payload = event_scored_payload(event)
+    if _msgpack is not None and config.EVENT_SCORED_MSGPACK:
+        return 'event_scored_bin', _msgpack.packb(payload, use_bin_type=True)
+    return 'event_scored', payload
+
+def emit_event_scored(event: EventItem):
+    _emit_threadsafe(*event_scored_message(event))
 
 def emit_ai_context_suggestion(streamer: str = None, context: str = None):
     _emit_threadsafe('ai_context_suggestion', {
@@ -184,8 +339,8 @@ def emit_ai_context_suggestion(streamer: str = None, context: str = None):
         'context_locked': is_context_locked()
     })
 
-def emit_director_state(summary, raw_context, prediction, mood, conversation_state, flow_state, user_intent, active_user, memories, directive, adaptive_state=None):
-    _emit_threadsafe('director_state', {
+def director_state_payload(summary, raw_context, prediction, mood, conversation_state, flow_state, user_intent, active_user, memories, directive, adaptive_state=None) -> dict:
+    return {
         'summary': summary, 
         'raw_context': raw_context,
         'prediction': prediction,
@@ -201,4 +356,4 @@ def emit_director_state(summary, raw_context, prediction, mood, conversation_sta
         'current_streamer': get_current_streamer(),
         'streamer_locked': is_streamer_locked(),
         'context_locked': is_context_locked()
-    })
\ No newline at end of file
+    }
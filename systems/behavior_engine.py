@@ -1,7 +1,6 @@
 # Save as: director_engine/systems/behavior_engine.py
 import time
 import random
-import asyncio
 from typing import List, Optional
 from config import (
     BotGoal, InputSource, ConversationState, FlowState, SceneType,
@@ -9,7 +8,6 @@ from config import (
 )
 from context.context_store import ContextStore, EventItem
 from scoring import EventScore
-from context.user_profile_manager import UserProfileManager
 import services.llm_analyst as llm_analyst
 
 
@@ -180,9 +178,12 @@ class BehaviorEngine:
 
         # Fire and forget — does NOT block this iteration
         self._monologue_task_inflight = True
-        asyncio.create_task(self._run_monologue_generation(
+        # spawn_background keeps a ref so the task (and its inflight-flag
+        # reset) can't be collected before it finishes.
+        import core_logic
+        core_logic.spawn_background(self._run_monologue_generation(
             topic, stream_context, watching_context, scene_name, store
-        ))
+        ), name="monologue")
         return None
 
     async def _run_monologue_generation(
@@ -2,8 +2,8 @@
 import time
 import re
 from typing import List, Dict, Any
-from context.context_store import ContextStore
-from config import InputSource
+from context.context_store import ContextStore, EventItem
+from config import InputSource, CHAT_SOURCES, MIC_SOURCES
 from scoring import EventScore
 
 # Article-anchored noun extraction — vision descriptions almost always say
@@ -27,6 +27,14 @@ _FIXATION_STOPWORDS = {
     "camera", "webcam", "microphone",
 }
 
+# Keyword tables for correlate(). Module-level tuples so they are not
+# rebuilt on every summary tick.
+_FAIL_TEXT_KEYWORDS = ("you died", "game over", "wasted", "mission failed", "retry", "defeat")
+# Based on your sample data: "red surrounding hue", "Explosions", "red backdrop"
+_FAIL_VISUAL_KEYWORDS = ("red surrounding", "red backdrop", "blood", "damage", "health low", "grey screen")
+_TILT_KEYWORDS = ("damn", "shit", "fuck", "no", "why", "stupid", "impossible", "dead", "died", "trash")
+_VICTORY_KEYWORDS = ("yes", "boom", "let's go", "lets go", "finally", "did it", "won", "beat")
+
 # How many *distinct* recent frames a noun must appear in before it counts.
 _FIXATION_MIN_FRAMES = 4
 # Fraction of the recent window the noun must cover (caps lock-in on
@@ -43,6 +51,10 @@ class CorrelationEngine:
         self.cooldown = 15.0  # Increased cooldown to prevent spam
         self.last_fixation_fired: Dict[str, float] = {}  # entity -> last fire time
         self.last_fixation_check = 0
+        # event id -> nouns extracted from that frame. Frames are immutable
+        # once stored, so each one is regex-scanned only on the first pass
+        # that sees it; later passes only pay for newly arrived frames.
+        self._frame_nouns_cache: Dict[str, frozenset] = {}
 
     def _calculate_momentum(self, history: List[str]) -> str:
         if len(history) < 3: return "Stable"
@@ -69,7 +81,7 @@ class CorrelationEngine:
                 nouns.add(noun)
         return nouns
 
-    def check_visual_fixations(self, store: ContextStore) -> List[Dict[str, Any]]:
+    def check_visual_fixations(self, recent: List[EventItem]) -> List[Dict[str, Any]]:
         """
         Detect recurring visual entities (Gymbag effect).
 
@@ -83,14 +95,23 @@ class CorrelationEngine:
             return []
         self.last_fixation_check = now
 
-        recent_visuals = [e.text for e in store.recent if e.source == InputSource.VISUAL_CHANGE]
+        recent_visuals = [e for e in recent if e.source == InputSource.VISUAL_CHANGE]
         if len(recent_visuals) < _FIXATION_MIN_FRAMES:
             return []
 
+        # Only frames still in the window are kept, so the cache stays
+        # bounded by the recent-layer size.
+        old_cache = self._frame_nouns_cache
+        cache: Dict[str, frozenset] = {}
         frames_per_noun: Dict[str, int] = {}
-        for desc in recent_visuals:
-            for noun in self._extract_frame_nouns(desc):
+        for e in recent_visuals:
+            nouns = old_cache.get(e.id)
+            if nouns is None:
+                nouns = frozenset(self._extract_frame_nouns(e.text))
+            cache[e.id] = nouns
+            for noun in nouns:
                 frames_per_noun[noun] = frames_per_noun.get(noun, 0) + 1
+        self._frame_nouns_cache = cache
 
         if not frames_per_noun:
             return []
@@ -124,36 +145,42 @@ class CorrelationEngine:
         
         patterns = []
         
+        # correlate runs on the tick executor, off the loop thread, so every
+        # layer it reads comes from this one copy taken under store.lock.
+        layers = store.get_all_events_for_summary()
+
         # --- [NEURO-FICATION] Fixations ---
-        fixations = self.check_visual_fixations(store)
+        fixations = self.check_visual_fixations(layers['recent'])
         patterns.extend(fixations)
         
-        layers = store.get_all_events_for_summary()
         events = layers['immediate'] + layers['recent']
         
         if not events: return patterns
 
-        visuals = [e for e in events if e.source == InputSource.VISUAL_CHANGE]
-        chat = [e for e in events if e.source in [InputSource.TWITCH_CHAT, InputSource.TWITCH_MENTION]]
-        speech = [e for e in events if e.source in [InputSource.MICROPHONE, InputSource.DIRECT_MICROPHONE]]
+        # One pass to bucket the window by source.
+        visuals, chat, speech = [], [], []
+        for e in events:
+            src = e.source
+            if src == InputSource.VISUAL_CHANGE:
+                visuals.append(e)
+            elif src in CHAT_SOURCES:
+                chat.append(e)
+            elif src in MIC_SOURCES:
+                speech.append(e)
 
         # --- [NEURO-FICATION] Skill Issue / Game Over Detection ---
-        # 1. Text Triggers (Literal reading)
-        fail_text_keywords = ["you died", "game over", "wasted", "mission failed", "retry", "defeat"]
-        
-        # 2. Visual Triggers (Vibes/Colors for when text is vague)
-        # Based on your sample data: "red surrounding hue", "Explosions", "red backdrop"
-        fail_visual_keywords = ["red surrounding", "red backdrop", "blood", "damage", "health low", "grey screen"]
+        # 1. Text Triggers (Literal reading) — _FAIL_TEXT_KEYWORDS
+        # 2. Visual Triggers (Vibes/Colors for when text is vague) — _FAIL_VISUAL_KEYWORDS
         
         recent_visual_text = " ".join([v.text.lower() for v in visuals[-3:]]) # Check last 3 frames
         
         is_fail = False
         fail_type = "unknown"
         
-        if any(k in recent_visual_text for k in fail_text_keywords):
+        if any(k in recent_visual_text for k in _FAIL_TEXT_KEYWORDS):
             is_fail = True
             fail_type = "text"
-        elif any(k in recent_visual_text for k in fail_visual_keywords):
+        elif any(k in recent_visual_text for k in _FAIL_VISUAL_KEYWORDS):
             # Only trigger on visuals if we haven't seen a victory recently
             is_fail = True
             fail_type = "visual_vibe"
@@ -189,8 +216,7 @@ class CorrelationEngine:
                 self.last_pattern_time = now
 
         # Tilt
-        tilt_keywords = ["damn", "shit", "fuck", "no", "why", "stupid", "impossible", "dead", "died", "trash"]
-        recent_frustration = sum(1 for s in speech if any(k in s.text.lower() for k in tilt_keywords) or s.metadata.get("sentiment") in ["frustrated", "angry"])
+        recent_frustration = sum(1 for s in speech if any(k in s.text.lower() for k in _TILT_KEYWORDS) or s.metadata.get("sentiment") in ["frustrated", "angry"])
         
         if recent_frustration >= 1: self.tilt_level = min(1.0, self.tilt_level + 0.25)
         else: self.tilt_level = max(0.0, self.tilt_level - 0.05)
@@ -204,8 +230,7 @@ class CorrelationEngine:
             self.last_pattern_time = now
 
         # Victory
-        victory_keywords = ["yes", "boom", "let's go", "lets go", "finally", "did it", "won", "beat"]
-        clutch_speech = [s for s in speech if any(k in s.text.lower() for k in victory_keywords)]
+        clutch_speech = [s for s in speech if any(k in s.text.lower() for k in _VICTORY_KEYWORDS)]
         if any(s.score.emotional_intensity > 0.7 and s.metadata.get("sentiment") in ["excited", "positive"] for s in clutch_speech):
             if now - self.last_pattern_time > self.cooldown:
                 patterns.append({
@@ -1,8 +1,8 @@
 # Save as: director_engine/decision_engine.py
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any
+from typing import List
 from config import BotGoal, ConversationState, FlowState, InputSource
-from context.context_store import ContextStore, EventItem
+from context.context_store import ContextStore
 from systems.behavior_engine import BehaviorEngine
 from systems.adaptive_controller import AdaptiveController
 from systems.energy_system import EnergySystem
@@ -24,6 +24,20 @@ class SceneManager:
         recent = layers['recent']
         chat_vel, energy = store.get_activity_metrics()
         conv_state = store.current_conversation_state
+
+        # One pass over recent for every per-source aggregate the rules below
+        # need, instead of a separate scan per rule.
+        visual_count = 0
+        ambient_audio_count = 0
+        meme_seen = False
+        for e in recent:
+            src = e.source
+            if src is InputSource.VISUAL_CHANGE:
+                visual_count += 1
+            elif src is InputSource.AMBIENT_AUDIO:
+                ambient_audio_count += 1
+            elif src is InputSource.SYSTEM_PATTERN and not meme_seen and "Meme" in e.text:
+                meme_seen = True
         
         # 2. Calculate Confidence for Potential Scenes
         scores = {scene: 0.0 for scene in SceneType}
@@ -36,7 +50,7 @@ class SceneManager:
             scores[SceneType.HORROR_TENSION] += 0.8
             
         # COMEDY: Check for meme pattern
-        if any(e.source == InputSource.SYSTEM_PATTERN and "Meme" in e.text for e in recent):
+        if meme_seen:
             scores[SceneType.COMEDY_MOMENT] += 0.9
             
         # COMBAT: High energy + state
@@ -45,7 +59,6 @@ class SceneManager:
             
         # MENUING: Low energy + visuals
         # Heuristic: low energy but visual activity
-        visual_count = len([e for e in recent if e.source == InputSource.VISUAL_CHANGE])
         if energy < 0.3 and visual_count > 5:
              scores[SceneType.MENUING] += 0.7
             
@@ -58,9 +71,6 @@ class SceneManager:
         # whether the silence is "locked in" or "fading".
         host_state = store.host_state
         if host_state in (HostState.QUIET, HostState.FADING):
-            ambient_audio_count = sum(
-                1 for e in recent if e.source == InputSource.AMBIENT_AUDIO
-            )
             if ambient_audio_count >= GAME_AUDIO_BUSY_THRESHOLD:
                 # Game is loud, he's locked in — don't pull focus
                 scores[SceneType.HOST_FOCUSED_QUIET] += 0.75